@@ -15,6 +15,7 @@
 
 from typing import Sequence, Union
 
+from ai_edge_torch._convert.fx_passes.build_aten_composite_pass import BuildAtenCompositeAndCanonicalizePass
 from ai_edge_torch._convert.fx_passes.build_aten_composite_pass import BuildAtenCompositePass
 from ai_edge_torch._convert.fx_passes.cast_inputs_bf16_to_f32_pass import CastInputsBf16ToF32Pass
 from ai_edge_torch._convert.fx_passes.inject_mlir_debuginfo_pass import InjectMlirDebuginfoPass
@@ -350,3 +350,25 @@ class BuildAtenCompositePass(fx_infra.PassBase):
     graph_module.graph.lint()
     graph_module.recompile()
     return fx_infra.PassResult(graph_module, True)
+
+
+class BuildAtenCompositeAndCanonicalizePass(fx_infra.ExportedProgramPassBase):
+  """Builds aten composites and canonicalizes the program in one pass.
+
+  Fuses BuildAtenCompositePass with fx_infra.CanonicalizePass: the composite
+  rewrite runs directly on the exported program's graph module and the
+  canonicalizing retrace follows immediately, so pipelines that always run
+  the two back to back only pay one pass dispatch and one graph recompile.
+  """
+
+  def call(self, exported_program: torch.export.ExportedProgram):
+    graph_module = exported_program.graph_module
+    for node in graph_module.graph.nodes:
+      if node.target in _composite_builders:
+        _composite_builders[node.target](graph_module, node)
+
+    graph_module.graph.lint()
+    graph_module.recompile()
+
+    exported_program = fx_infra.safe_run_decompositions(exported_program, {})
+    return fx_infra.ExportedProgramPassResult(exported_program, True)
@@ -22,6 +22,32 @@ from ai_edge_torch._convert import fx_passes
 import torch
 
 from absl.testing import absltest as googletest
+from absl.testing import parameterized
+
+# Shared seeded inputs for the common shapes. The tests only assert on the
+# emitted MLIR text, which is independent of the input values, so reusing one
+# tensor per shape across tests is safe and avoids per-test RNG and allocator
+# churn.
+_RNG = torch.Generator().manual_seed(0)
+_INPUT_10_10 = torch.rand(10, 10, generator=_RNG)
+_INPUT_1_3_6_6 = torch.rand(1, 3, 6, 6, generator=_RNG)
+_INPUT_1_3_10_10 = torch.rand(1, 3, 10, 10, generator=_RNG)
+_INPUT_INDICES_1_10 = torch.full((1, 10), 0, dtype=torch.long)
+
+# The pass is stateless across runs, so every test shares one instance
+# instead of re-constructing it per export.
+_PASSES = [fx_passes.BuildAtenCompositeAndCanonicalizePass()]
+
+
+class _CallableWrapper(torch.nn.Module):
+  """Wraps a plain callable as a module for torch.export."""
+
+  def __init__(self, fn):
+    super().__init__()
+    self._fn = fn
+
+  def forward(self, *args, **kwargs):
+    return self._fn(*args, **kwargs)
 
 
 def _export_to_stablehlo_with_composite(
@@ -37,38 +63,29 @@ def _export_to_stablehlo_with_composite(
     A StableHLO program in MLIR text format.
   """
   if not isinstance(func, torch.nn.Module):
-
-    class TestModule(torch.nn.Module):
-
-      def forward(self, *args, **kwargs):
-        return func(*args, **kwargs)
-
-    module = TestModule().eval()
+    module = _CallableWrapper(func).eval()
   else:
     module = func
 
-  exported_program = torch.export.export(module, export_args)
+  # These tests export small callables with concrete input shapes and no
+  # control flow, so the lighter non-strict (make_fx) tracer is sufficient
+  # and avoids Dynamo's bytecode analysis and guard accumulation.
+  exported_program = torch.export.export(module, export_args, strict=False)
   exported_program = fx_infra.safe_run_decompositions(
       exported_program,
       fx_infra.decomp.pre_convert_decomp(),
   )
-  exported_program = fx_infra.run_passes(
-      exported_program,
-      [
-          fx_passes.BuildAtenCompositePass(),
-          fx_passes.CanonicalizePass(),
-      ],
-  )
+  exported_program = fx_infra.run_passes(exported_program, _PASSES)
 
   return lowertools.exported_program_to_mlir_text(exported_program)
 
 
-class TestBuildAtenCompositePass(googletest.TestCase):
+class TestBuildAtenCompositePass(parameterized.TestCase):
   """Tests for BuildAtenCompositePass."""
 
   def test_hardswish_layer(self):
     stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.Hardswish()(x), (torch.rand(10, 10),)  # pylint: disable=unnecessary-lambda
+        lambda x: torch.nn.Hardswish()(x), (_INPUT_10_10,)  # pylint: disable=unnecessary-lambda
     )
 
     lowertools.assert_string_count(
@@ -80,7 +97,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
 
   def test_hardswish_op(self):
     stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.ops.aten.hardswish.default(x), (torch.rand(10, 10),)  # pylint: disable=unnecessary-lambda
+        lambda x: torch.ops.aten.hardswish.default(x), (_INPUT_10_10,)  # pylint: disable=unnecessary-lambda
     )
 
     lowertools.assert_string_count(
@@ -101,7 +118,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
             count_include_pad=True,
             divisor_override=None,
         )(x),
-        (torch.rand(1, 3, 6, 6),),
+        (_INPUT_1_3_6_6,),
     )
     lowertools.assert_string_count(
         self,
@@ -122,7 +139,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
             count_include_pad=False,
             divisor_override=None,
         ),
-        (torch.rand(1, 3, 6, 6),),
+        (_INPUT_1_3_6_6,),
     )
     lowertools.assert_string_count(
         self,
@@ -143,7 +160,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
             count_include_pad=True,
             divisor_override=None,
         ),
-        (torch.rand(1, 3, 6, 6),),
+        (_INPUT_1_3_6_6,),
     )
     lowertools.assert_string_count(
         self,
@@ -154,7 +171,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
 
   def test_gelu_layer(self):
     stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.GELU()(x), (torch.rand(10, 10),)  # pylint: disable=unnecessary-lambda
+        lambda x: torch.nn.GELU()(x), (_INPUT_10_10,)  # pylint: disable=unnecessary-lambda
     )
     lowertools.assert_string_count(
         self,
@@ -165,7 +182,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
 
   def test_approximate_gelu_layer(self):
     stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.GELU('tanh')(x), (torch.rand(10, 10),)  # pylint: disable=unnecessary-lambda
+        lambda x: torch.nn.GELU('tanh')(x), (_INPUT_10_10,)  # pylint: disable=unnecessary-lambda
     )
     lowertools.assert_string_count(
         self,
@@ -176,7 +193,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
 
   def test_embedding_lookup_layer(self):
     stablehlo = _export_to_stablehlo_with_composite(
-        torch.nn.Embedding(10, 10), (torch.full((1, 10), 0, dtype=torch.long),)
+        torch.nn.Embedding(10, 10), (_INPUT_INDICES_1_10,)
     )
     lowertools.assert_string_count(
         self,
@@ -188,7 +205,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
   def test_embedding_lookup_op(self):
     stablehlo = _export_to_stablehlo_with_composite(
         torch.ops.aten.embedding.default,
-        (torch.rand(10, 10), torch.full((1, 10), 0, dtype=torch.long)),
+        (_INPUT_10_10, _INPUT_INDICES_1_10),
     )
     lowertools.assert_string_count(
         self,
@@ -200,10 +217,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
   def test_embedding_lookup_functional(self):
     stablehlo = _export_to_stablehlo_with_composite(
         torch.nn.functional.embedding,
-        (
-            torch.full((1, 10), 0, dtype=torch.long),
-            torch.rand(10, 10),
-        ),
+        (_INPUT_INDICES_1_10, _INPUT_10_10),
     )
     lowertools.assert_string_count(
         self,
@@ -212,94 +226,88 @@ class TestBuildAtenCompositePass(googletest.TestCase):
         {'stablehlo.custom_call @mark_tensor': 3},
     )
 
-  def test_nn_functional_upsample_bilinear(self):
-    stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.functional.upsample(
-            x, scale_factor=3.0, mode='bilinear'
-        ),
-        (torch.rand(1, 3, 10, 10),),
-    )
-
-    lowertools.assert_string_count(
-        self,
-        stablehlo,
-        {
-            'stablehlo.composite "odml.upsample_bilinear2d"': 1,
-            'composite_attributes = {align_corners = false, is_nchw_op = true, size = dense<30> : tensor<2xi64>}': (
-                1
-            ),
-        },
-        {'stablehlo.custom_call @mark_tensor': 2},
-        {'{"size": [30, 30], "align_corners": false, "is_nchw_op": true}': 1},
-    )
-
-  def test_nn_functional_upsample_bilinear_align_corners(self):
+  @parameterized.named_parameters(
+      ('upsample_scale', torch.nn.functional.upsample, 3.0, None, False),
+      (
+          'upsample_scale_align_corners',
+          torch.nn.functional.upsample,
+          3.0,
+          None,
+          True,
+      ),
+      ('upsample_size', torch.nn.functional.upsample, None, [15, 20], False),
+      (
+          'upsample_size_align_corners',
+          torch.nn.functional.upsample,
+          None,
+          [15, 20],
+          True,
+      ),
+      ('interpolate_scale', torch.nn.functional.interpolate, 3.0, None, False),
+      (
+          'interpolate_scale_align_corners',
+          torch.nn.functional.interpolate,
+          3.0,
+          None,
+          True,
+      ),
+      (
+          'interpolate_size',
+          torch.nn.functional.interpolate,
+          None,
+          [15, 20],
+          False,
+      ),
+      (
+          'interpolate_size_align_corners',
+          torch.nn.functional.interpolate,
+          None,
+          [15, 20],
+          True,
+      ),
+  )
+  def test_nn_functional_upsample_interpolate_bilinear(
+      self, op, scale_factor, size, align_corners
+  ):
     stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.functional.upsample(
-            x, scale_factor=3.0, mode='bilinear', align_corners=True
+        lambda x: op(
+            x,
+            scale_factor=scale_factor,
+            size=size,
+            mode='bilinear',
+            align_corners=align_corners,
         ),
-        (torch.rand(1, 3, 10, 10),),
+        (_INPUT_1_3_10_10,),
     )
 
-    lowertools.assert_string_count(
-        self,
-        stablehlo,
-        {
-            'stablehlo.composite "odml.upsample_bilinear2d"': 1,
-            'composite_attributes = {align_corners = true, is_nchw_op = true, size = dense<30> : tensor<2xi64>}': (
-                1
-            ),
-        },
-        {'stablehlo.custom_call @mark_tensor': 2},
-        {'{"size": [30, 30], "align_corners": true, "is_nchw_op": true}': 1},
-    )
-
-  def test_nn_functional_upsample_bilinear_size(self):
-    stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.functional.upsample(
-            x, size=[15, 20], mode='bilinear'
-        ),
-        (torch.rand(1, 3, 10, 10),),
-    )
+    if size is None:
+      size = [30, 30]
+      size_attr = 'dense<30>'
+    else:
+      size_attr = f'dense<[{size[0]}, {size[1]}]>'
+    align_corners_attr = 'true' if align_corners else 'false'
 
     lowertools.assert_string_count(
         self,
         stablehlo,
         {
             'stablehlo.composite "odml.upsample_bilinear2d"': 1,
-            'composite_attributes = {align_corners = false, is_nchw_op = true, size = dense<[15, 20]> : tensor<2xi64>}': (
+            f'composite_attributes = {{align_corners = {align_corners_attr}, is_nchw_op = true, size = {size_attr} : tensor<2xi64>}}': (
                 1
             ),
         },
         {'stablehlo.custom_call @mark_tensor': 2},
-        {'{"size": [15, 20], "align_corners": false, "is_nchw_op": true}': 1},
-    )
-
-  def test_nn_functional_upsample_bilinear_size_align_corners(self):
-    stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.functional.upsample(
-            x, size=[15, 20], mode='bilinear', align_corners=True
-        ),
-        (torch.rand(1, 3, 10, 10),),
-    )
-
-    lowertools.assert_string_count(
-        self,
-        stablehlo,
         {
-            'stablehlo.composite "odml.upsample_bilinear2d"': 1,
-            'composite_attributes = {align_corners = true, is_nchw_op = true, size = dense<[15, 20]> : tensor<2xi64>}': (
+            f'{{"size": [{size[0]}, {size[1]}], "align_corners": {align_corners_attr}, "is_nchw_op": true}}': (
                 1
-            ),
+            )
         },
-        {'stablehlo.custom_call @mark_tensor': 2},
-        {'{"size": [15, 20], "align_corners": true, "is_nchw_op": true}': 1},
     )
 
   def test_nn_upsample_bilinear(self):
     stablehlo = _export_to_stablehlo_with_composite(
         torch.nn.Upsample(scale_factor=3.0, mode='bilinear').eval(),
-        (torch.rand(1, 3, 10, 10),),
+        (_INPUT_1_3_10_10,),
     )
     lowertools.assert_string_count(
         self,
@@ -314,92 +322,12 @@ class TestBuildAtenCompositePass(googletest.TestCase):
         {'{"size": [30, 30], "align_corners": false, "is_nchw_op": true}': 1},
     )
 
-  def test_nn_functional_interpolate_bilinear(self):
-    stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.functional.interpolate(
-            x, scale_factor=3.0, mode='bilinear'
-        ),
-        (torch.rand(1, 3, 10, 10),),
-    )
-    lowertools.assert_string_count(
-        self,
-        stablehlo,
-        {
-            'stablehlo.composite "odml.upsample_bilinear2d"': 1,
-            'composite_attributes = {align_corners = false, is_nchw_op = true, size = dense<30> : tensor<2xi64>}': (
-                1
-            ),
-        },
-        {'stablehlo.custom_call @mark_tensor': 2},
-        {'{"size": [30, 30], "align_corners": false, "is_nchw_op": true}': 1},
-    )
-
-  def test_nn_functional_interpolate_bilinear_align_corners(self):
-    stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.functional.interpolate(
-            x, scale_factor=3.0, mode='bilinear', align_corners=True
-        ),
-        (torch.rand(1, 3, 10, 10),),
-    )
-    lowertools.assert_string_count(
-        self,
-        stablehlo,
-        {
-            'stablehlo.composite "odml.upsample_bilinear2d"': 1,
-            'composite_attributes = {align_corners = true, is_nchw_op = true, size = dense<30> : tensor<2xi64>}': (
-                1
-            ),
-        },
-        {'stablehlo.custom_call @mark_tensor': 2},
-        {'{"size": [30, 30], "align_corners": true, "is_nchw_op": true}': 1},
-    )
-
-  def test_nn_functional_interpolate_bilinear_size(self):
-    stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.functional.interpolate(
-            x, size=[15, 20], mode='bilinear'
-        ),
-        (torch.rand(1, 3, 10, 10),),
-    )
-    lowertools.assert_string_count(
-        self,
-        stablehlo,
-        {
-            'stablehlo.composite "odml.upsample_bilinear2d"': 1,
-            'composite_attributes = {align_corners = false, is_nchw_op = true, size = dense<[15, 20]> : tensor<2xi64>}': (
-                1
-            ),
-        },
-        {'stablehlo.custom_call @mark_tensor': 2},
-        {'{"size": [15, 20], "align_corners": false, "is_nchw_op": true}': 1},
-    )
-
-  def test_nn_functional_interpolate_bilinear_size_align_corners(self):
-    stablehlo = _export_to_stablehlo_with_composite(
-        lambda x: torch.nn.functional.interpolate(
-            x, size=[15, 20], mode='bilinear', align_corners=True
-        ),
-        (torch.rand(1, 3, 10, 10),),
-    )
-    lowertools.assert_string_count(
-        self,
-        stablehlo,
-        {
-            'stablehlo.composite "odml.upsample_bilinear2d"': 1,
-            'composite_attributes = {align_corners = true, is_nchw_op = true, size = dense<[15, 20]> : tensor<2xi64>}': (
-                1
-            ),
-        },
-        {'stablehlo.custom_call @mark_tensor': 2},
-        {'{"size": [15, 20], "align_corners": true, "is_nchw_op": true}': 1},
-    )
-
   def test_nn_functional_interpolate_nearest(self):
     stablehlo = _export_to_stablehlo_with_composite(
         lambda x: torch.nn.functional.interpolate(
             x, scale_factor=3.0, mode='nearest'
         ),
-        (torch.rand(1, 3, 10, 10),),
+        (_INPUT_1_3_10_10,),
     )
     lowertools.assert_string_count(
         self,
@@ -419,7 +347,7 @@ class TestBuildAtenCompositePass(googletest.TestCase):
         lambda x: torch.nn.functional.interpolate(
             x, size=[15, 20], mode='nearest'
         ),
-        (torch.rand(1, 3, 10, 10),),
+        (_INPUT_1_3_10_10,),
     )
     lowertools.assert_string_count(
         self,
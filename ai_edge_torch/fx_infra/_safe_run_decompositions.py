@@ -27,13 +27,50 @@ _DUMMY_DECOMP_TABLE = {
 }
 
 
+def _decompositions_needed(exported_program, decomp_table) -> bool:
+  """Returns False if run_decompositions would be a no-op for the program."""
+  # Only the top-level graph is inspected; if submodule-carrying higher-order
+  # ops (e.g. torch.cond) are ever exported through here, their submodules
+  # must be walked as well before the retrace can be skipped.
+  graph_ops = set()
+  for node in exported_program.graph.nodes:
+    if node.op != "call_function":
+      continue
+    if node.target == torch.ops.aten.view.default:
+      # aten.view nodes need the memory-format fixup and retrace below.
+      return True
+    graph_ops.add(node.target)
+
+  if hasattr(torch.ops.aten, "_assert_tensor_metadata") and (
+      torch.ops.aten._assert_tensor_metadata.default in graph_ops
+  ):
+    return True
+
+  return not graph_ops.isdisjoint(decomp_table)
+
+
 def safe_run_decompositions(exported_program, decomp_table=None):
-  """Wrapper for ExportedProgram.run_decompositions to handle unexpected export behavior."""
+  """Wrapper for ExportedProgram.run_decompositions to handle unexpected export behavior.
+
+  Note: when no op in the graph matches decomp_table the input program is
+  returned as-is, not a fresh program from run_decompositions. Callers that
+  keep a reference to the input program and mutate the returned one in place
+  must not rely on the two being distinct objects.
+  """
 
   if decomp_table is not None and not decomp_table:
     # Empty decomp table means no op decompositions. Use dummy decomp table
     # instead for backward compatibility.
     decomp_table = _DUMMY_DECOMP_TABLE
+  elif decomp_table is not None and not _decompositions_needed(
+      exported_program, decomp_table
+  ):
+    # No op in the graph matches the decomp table and no node needs the
+    # fixups below, so the retrace would only reproduce the same program.
+    # Note decomp_table=None runs the default aten-coreaten decompositions
+    # and the dummy table requests a canonicalizing retrace; neither can be
+    # skipped.
+    return exported_program
 
   for node in exported_program.graph.nodes:
     if node.target == torch.ops.aten.view.default:
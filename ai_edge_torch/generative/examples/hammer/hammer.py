@@ -15,6 +15,9 @@
 
 """Example of building Hammer 2.1 models."""
 
+import copy
+import functools
+
 import ai_edge_torch.generative.layers.model_config as cfg
 from ai_edge_torch.generative.utilities import model_builder
 from torch import nn
@@ -27,6 +30,7 @@ class Hammer(model_builder.DecoderOnlyModel):
   pass
 
 
+@functools.lru_cache(maxsize=None)
 def get_1_5b_model_config(kv_cache_max_len: int = 1024) -> cfg.ModelConfig:
   """Returns the model config for a Hammer 2.1 1.5B model."""
   attn_config = cfg.AttentionConfig(
@@ -66,9 +70,11 @@ def get_1_5b_model_config(kv_cache_max_len: int = 1024) -> cfg.ModelConfig:
   return config
 
 
+@functools.lru_cache(maxsize=None)
 def get_0_5b_model_config(kv_cache_max_len: int = 1024) -> cfg.ModelConfig:
   """Returns the model config for a Hammer 2.1 0.5B model."""
-  config = get_1_5b_model_config(kv_cache_max_len)
+  # Deep-copy so the cached 1.5B config is not mutated below.
+  config = copy.deepcopy(get_1_5b_model_config(kv_cache_max_len))
   # Hammer has only one block config.
   block_config = config.block_config(0)
   block_config.attn_config.num_heads = 14
@@ -80,7 +86,7 @@ def get_0_5b_model_config(kv_cache_max_len: int = 1024) -> cfg.ModelConfig:
 
 
 def get_fake_model_config(**kwargs) -> cfg.ModelConfig:
-  config = get_1_5b_model_config(**kwargs)
+  config = copy.deepcopy(get_1_5b_model_config(**kwargs))
   config.vocab_size = 128
   config.num_layers = 2
   config.embedding_dim = 16
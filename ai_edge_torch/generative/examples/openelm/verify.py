@@ -15,15 +15,15 @@
 
 """Verifies the reauthored OpenELM-3B model."""
 
+import functools
 import logging
 import pathlib
 from absl import app
 from absl import flags
-from ai_edge_torch.generative.examples.openelm import openelm
-from ai_edge_torch.generative.utilities import transformers_verifier
-from ai_edge_torch.generative.utilities import verifier
-import transformers
 
+# transformers and the ai_edge_torch model/verifier modules are imported
+# lazily inside the functions below: they are expensive to import and are not
+# needed when this script is merely imported (e.g. during test collection).
 
 _PROMPTS = flags.DEFINE_multi_string(
     "prompts",
@@ -37,12 +37,34 @@ _MAX_NEW_TOKENS = flags.DEFINE_integer(
 )
 
 
+@functools.lru_cache(maxsize=4)
+def _load_causal_lm(checkpoint: str) -> "transformers.PreTrainedModel":
+  """Loads and caches the original model for the checkpoint."""
+  import transformers
+
+  return transformers.AutoModelForCausalLM.from_pretrained(
+      checkpoint, trust_remote_code=True, low_cpu_mem_usage=True
+  )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tokenizer(checkpoint: str) -> "transformers.PreTrainedTokenizer":
+  """Loads and caches the tokenizer for the checkpoint."""
+  import transformers
+
+  return transformers.AutoTokenizer.from_pretrained(checkpoint)
+
+
 def main(_):
+  import transformers
+
+  from ai_edge_torch.generative.examples.openelm import openelm
+  from ai_edge_torch.generative.utilities import transformers_verifier
+  from ai_edge_torch.generative.utilities import verifier
+
   checkpoint = "apple/OpenELM-3B"
   logging.info("Loading the original model from: %s", checkpoint)
-  original_model = transformers.AutoModelForCausalLM.from_pretrained(
-      checkpoint, trust_remote_code=True
-  )
+  original_model = _load_causal_lm(checkpoint)
 
   # Locate the cached dir.
   cached_config_file = transformers.utils.cached_file(
@@ -54,7 +76,7 @@ def main(_):
 
   tokenizer_checkpoint = "meta-llama/Llama-2-7b-hf"
   logging.info("Loading the tokenizer from: %s", tokenizer_checkpoint)
-  tokenizer = transformers.AutoTokenizer.from_pretrained(tokenizer_checkpoint)
+  tokenizer = _load_tokenizer(tokenizer_checkpoint)
 
   verifier.verify_reauthored_model(
       original_model=transformers_verifier.TransformersModelWrapper(
@@ -25,6 +25,7 @@ config = _config.config
 # isort: off
 if config.use_torch_xla:
   from ai_edge_torch.lowertools import torch_xla_utils as utils
+  from ai_edge_torch.lowertools.torch_xla_utils import exported_program_to_mlir_stream
   from ai_edge_torch.lowertools.torch_xla_utils import exported_program_to_mlir_text
   from torch_xla.experimental.mark_pattern_utils import StableHLOCompositeBuilder
   from torch_xla.experimental.xla_marker import serialize_composite_attr
@@ -36,6 +37,7 @@ if config.use_torch_xla:
   write_mlir_debuginfo_op = torch.ops.xla.write_mlir_debuginfo.default
 else:
   from ai_edge_torch.lowertools import odml_torch_utils as utils
+  from ai_edge_torch.lowertools.odml_torch_utils import exported_program_to_mlir_stream
   from ai_edge_torch.lowertools.odml_torch_utils import exported_program_to_mlir_text
   from ai_edge_torch.odml_torch.composite import StableHLOCompositeBuilder
   from ai_edge_torch.odml_torch.composite.mark_tensor import serialize_composite_attr
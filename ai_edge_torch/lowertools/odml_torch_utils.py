@@ -228,6 +228,20 @@ def exported_program_to_mlir_text(
   )
 
 
+def exported_program_to_mlir_stream(
+    exported_program: torch.export.ExportedProgram,
+    writer,
+) -> None:
+  """Writes the MLIR text of a ExportedProgram to a writable object.
+
+  The MLIR printer streams chunks directly into the writer, so the full
+  module text is never materialized as one Python string.
+  """
+  odml_torch.export.exported_program_to_mlir(exported_program).write_text(
+      writer, enable_debug_info=True
+  )
+
+
 def exported_program_to_mlir(
     exported_program: torch.export.ExportedProgram,
     sample_args: tuple[torch.Tensor],
@@ -0,0 +1,53 @@
+# Copyright 2025 The AI Edge Torch Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for exported_program_to_mlir_stream."""
+
+import io
+
+from ai_edge_torch import fx_infra
+from ai_edge_torch import lowertools
+import torch
+
+from absl.testing import absltest as googletest
+
+
+class TestExportedProgramToMlirStream(googletest.TestCase):
+  """Tests for exported_program_to_mlir_stream."""
+
+  def test_stream_matches_mlir_text(self):
+
+    class SampleModel(torch.nn.Module):
+
+      def forward(self, x):
+        return x * x + x
+
+    exported_program = torch.export.export(
+        SampleModel().eval(), (torch.rand(10, 10),)
+    )
+    exported_program = fx_infra.safe_run_decompositions(
+        exported_program, fx_infra.decomp.pre_lower_decomp()
+    )
+
+    buffer = io.StringIO()
+    lowertools.exported_program_to_mlir_stream(exported_program, buffer)
+
+    self.assertEqual(
+        buffer.getvalue(),
+        lowertools.exported_program_to_mlir_text(exported_program),
+    )
+
+
+if __name__ == "__main__":
+  googletest.main()
@@ -29,6 +29,50 @@ def _extract_backend_configs(mlir):
   return "\n".join(configs)
 
 
+def _can_self_overlap(needle: str):
+  return any(needle[:i] == needle[-i:] for i in range(1, len(needle)))
+
+
+def _count_substrings(text: str, needles) -> dict[str, int]:
+  """Counts the occurrences of every needle in text in a single scan.
+
+  Equivalent to {needle: text.count(needle)}, but scans the text once with a
+  compiled regex alternation instead of once per needle. Falls back to
+  per-needle counting in the corner cases where the alternation would count
+  differently (a needle being a prefix of another, or overlapping with
+  itself).
+
+  Args:
+    text: The text to scan.
+    needles: The substrings to count.
+
+  Returns:
+    A dict mapping each needle to its occurrence count in text.
+  """
+  needles = list(needles)
+  if not needles:
+    return {}
+  if (
+      len(needles) == 1
+      or any(_can_self_overlap(needle) for needle in needles)
+      or any(a != b and b.startswith(a) for a in needles for b in needles)
+  ):
+    return {needle: text.count(needle) for needle in needles}
+
+  pattern = re.compile(
+      "(?=({}))".format(
+          "|".join(
+              re.escape(needle)
+              for needle in sorted(needles, key=len, reverse=True)
+          )
+      )
+  )
+  counts = dict.fromkeys(needles, 0)
+  for match in pattern.finditer(text):
+    counts[match.group(1)] += 1
+  return counts
+
+
 def assert_string_count(
     test_case: googletest.TestCase,
     mlir: str,
@@ -41,22 +85,25 @@ def assert_string_count(
     odml_torch_attr_counter = {}
 
   if config.use_torch_xla:
+    counts = _count_substrings(mlir, torch_xla_pattern_counter)
     for key in torch_xla_pattern_counter:
       test_case.assertEqual(
-          mlir.count(key),
+          counts[key],
           torch_xla_pattern_counter[key],
       )
   else:
+    counts = _count_substrings(mlir, odml_torch_pattern_counter)
     for key in odml_torch_pattern_counter:
       test_case.assertEqual(
-          mlir.count(key),
+          counts[key],
           odml_torch_pattern_counter[key],
       )
     backend_configs = _extract_backend_configs(mlir)
     print("backend_configs:")
     print(backend_configs)
+    attr_counts = _count_substrings(backend_configs, odml_torch_attr_counter)
     for key in odml_torch_attr_counter:
       test_case.assertEqual(
-          backend_configs.count(key),
+          attr_counts[key],
           odml_torch_attr_counter[key],
       )
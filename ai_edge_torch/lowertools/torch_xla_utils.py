@@ -189,6 +189,18 @@ def exported_program_to_mlir_text(
   ).get_stablehlo_text()
 
 
+def exported_program_to_mlir_stream(
+    exported_program: torch.export.ExportedProgram,
+    writer,
+) -> None:
+  """Writes the MLIR text of a ExportedProgram to a writable object.
+
+  torch_xla only exposes fully materialized StableHLO text, so this writes
+  that text through in a single chunk.
+  """
+  writer.write(exported_program_to_mlir_text(exported_program))
+
+
 def merged_bundle_to_tfl_model(
     merged_bundle: MergedBundle,
     signatures: list[signature_module.Signature],
@@ -13,7 +13,8 @@
 # limitations under the License.
 # ==============================================================================
 """Torch-TFL op definitions and fake implementations."""
-import re
+
+import math
 from typing import Sequence
 from ai_edge_torch.odml_torch.experimental.torch_tfl import torch_library_utils
 import torch
@@ -27,66 +28,59 @@ def tfl_batch_matmul(
 ) -> torch.Tensor:
   if x.ndim < 2 or y.ndim < 2:
     raise ValueError("Input tensors must have at least 2 dimensions.")
-  if adj_x:
-    x = torch.transpose(x, -1, -2)
-  if adj_y:
-    y = torch.transpose(y, -1, -2)
+  # .mT is a zero-copy stride swap of the last two dimensions.
+  x = x.mT if adj_x else x
+  y = y.mT if adj_y else y
   return torch.matmul(x, y)
 
 
-@custom_op_with_fake("tfl::add")
-def tfl_add(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-  return torch.add(x, y)
-
-
-@custom_op_with_fake("tfl::sub")
-def tfl_sub(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-  return torch.sub(x, y)
-
-
-@custom_op_with_fake("tfl::mul")
-def tfl_mul(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-  return torch.mul(x, y)
-
+# Trivial pointwise ops that forward 1:1 to a torch function. The wrappers
+# are generated from these tables so each is a minimal forwarding function
+# with no per-op boilerplate. The wrapper signatures stay fully annotated
+# because torch.library.custom_op derives the op schema from them.
+_BINARY_OPS = {
+    "add": torch.add,
+    "sub": torch.sub,
+    "mul": torch.mul,
+    "div": torch.div,
+    "greater": torch.gt,
+    "less": torch.lt,
+    "maximum": torch.maximum,
+    "minimum": torch.minimum,
+}
 
-@custom_op_with_fake("tfl::div")
-def tfl_div(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-  return torch.div(x, y)
+_UNARY_OPS = {
+    "sin": torch.sin,
+    "cos": torch.cos,
+    "rsqrt": torch.rsqrt,
+}
 
 
-@custom_op_with_fake("tfl::greater")
-def tfl_greater(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-  return torch.gt(x, y)
+def _define_binary_op(name, torch_fn):
+  def op(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+    return torch_fn(x, y)
 
+  op.__name__ = f"tfl_{name}"
+  op.__qualname__ = op.__name__
+  return custom_op_with_fake(f"tfl::{name}")(op)
 
-@custom_op_with_fake("tfl::less")
-def tfl_less(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-  return torch.lt(x, y)
 
+def _define_unary_op(name, torch_fn):
+  def op(x: torch.Tensor) -> torch.Tensor:
+    return torch_fn(x)
 
-@custom_op_with_fake("tfl::maximum")
-def tfl_maximum(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-  return torch.maximum(x, y)
+  op.__name__ = f"tfl_{name}"
+  op.__qualname__ = op.__name__
+  return custom_op_with_fake(f"tfl::{name}")(op)
 
 
-@custom_op_with_fake("tfl::minimum")
-def tfl_minimum(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
-  return torch.minimum(x, y)
+for _name, _torch_fn in _BINARY_OPS.items():
+  globals()[f"tfl_{_name}"] = _define_binary_op(_name, _torch_fn)
 
+for _name, _torch_fn in _UNARY_OPS.items():
+  globals()[f"tfl_{_name}"] = _define_unary_op(_name, _torch_fn)
 
-@custom_op_with_fake("tfl::sin")
-def tfl_sin(x: torch.Tensor) -> torch.Tensor:
-  return torch.sin(x)
-
-
-@custom_op_with_fake("tfl::cos")
-def tfl_cos(x: torch.Tensor) -> torch.Tensor:
-  return torch.cos(x)
-
-
-@custom_op_with_fake("tfl::rsqrt")
-def tfl_rsqrt(x: torch.Tensor) -> torch.Tensor:
-  return torch.rsqrt(x)
+del _name, _torch_fn
 
 
 @custom_op_with_fake("tfl::gelu")
@@ -95,16 +89,29 @@ def tfl_gelu(x: torch.Tensor, approximate: bool = False) -> torch.Tensor:
   return torch.nn.functional.gelu(x, approximate=gelu_approximate)
 
 
-@custom_op_with_fake("tfl::transpose")
+# The shape-manipulation ops below (transpose, reshape, slice, slice.tensor)
+# produce views; the real implementations copy the view because custom op
+# outputs must not alias inputs. The explicit fake implementations construct
+# outputs from metadata only, so no data copy happens during export tracing.
+@torch.library.custom_op("tfl::transpose", mutates_args=())
 def tfl_transpose(input: torch.Tensor, perm: Sequence[int]) -> torch.Tensor:
   assert len(perm) == input.ndim
 
   return torch.permute(input, perm).clone()
 
 
+@torch.library.register_fake("tfl::transpose")
+def tfl_transpose_fake(
+    input: torch.Tensor, perm: Sequence[int]
+) -> torch.Tensor:
+  assert len(perm) == input.ndim
+
+  return torch.empty([input.shape[i] for i in perm], dtype=input.dtype)
+
+
 @torch.library.custom_op("tfl::reshape", mutates_args=())
 def tfl_reshape(input: torch.Tensor, shape: Sequence[int]) -> torch.Tensor:
-  assert torch.Size(shape).numel() == input.numel()
+  assert math.prod(shape) == input.numel()
 
   return input.view(shape).clone()
 
@@ -118,19 +125,37 @@ def tfl_reshape_fake(input: torch.Tensor, shape: Sequence[int]) -> torch.Tensor:
 
 @custom_op_with_fake("tfl::softmax")
 def tfl_softmax(x: torch.Tensor) -> torch.Tensor:
-  return torch.nn.functional.softmax(x)
+  # TFL softmax always runs on the last dimension; the decomposition permutes
+  # other dims to the last before emitting this op.
+  return torch.nn.functional.softmax(x, dim=-1)
 
 
-@custom_op_with_fake("tfl::slice")
+@torch.library.custom_op("tfl::slice", mutates_args=())
 def tfl_slice(
     input: torch.Tensor, begin: Sequence[int], size: Sequence[int]
 ) -> torch.Tensor:
   assert len(begin) == len(size) == input.ndim
 
+  if input.ndim == 4:
+    # Fast path for the dominant rank: index directly instead of allocating
+    # a slice object per dimension plus the list and tuple around them.
+    b0, b1, b2, b3 = begin
+    s0, s1, s2, s3 = size
+    return input[b0 : b0 + s0, b1 : b1 + s1, b2 : b2 + s2, b3 : b3 + s3].clone()
+
   slices = [slice(i, i + l) for i, l in zip(begin, size)]
   return input[tuple(slices)].clone()
 
 
+@torch.library.register_fake("tfl::slice")
+def tfl_slice_fake(
+    input: torch.Tensor, begin: Sequence[int], size: Sequence[int]
+) -> torch.Tensor:
+  assert len(begin) == len(size) == input.ndim
+
+  return torch.empty(list(size), dtype=input.dtype)
+
+
 @torch.library.custom_op("tfl::slice.tensor", mutates_args=())
 def tfl_slice_tensor(
     input: torch.Tensor,
@@ -144,8 +169,10 @@ def tfl_slice_tensor(
   assert begin.dtype == torch.int32 and size.dtype == torch.int32
   assert not shape or shape.count(",") == input.ndim - 1
 
-  slices = [slice(i, i + l) for i, l in zip(begin.tolist(), size.tolist())]
-  return input[tuple(slices)].clone()
+  out = input
+  for dim, (start, length) in enumerate(zip(begin.tolist(), size.tolist())):
+    out = out.narrow(dim, start, length)
+  return out.clone()
 
 
 @torch.library.register_fake("tfl::slice.tensor")
@@ -157,16 +184,15 @@ def tfl_slice_tensor_fake(
     shape: str = "",
 ) -> torch.Tensor:
   ctx = torch.library.get_ctx()
-  shape_str = shape
-  if not shape_str:
-    shape_str = ",".join(["?" for _ in range(input.ndim)])
-
-  shape = []
-  shape_symbols = shape_str.split(",")
-  for sym in shape_symbols:
-    if re.match(r"\d+", sym):
-      shape.append(int(sym))
+  if not shape:
+    # Common all-dynamic case: skip parsing entirely.
+    dims = [ctx.new_dynamic_size() for _ in range(input.ndim)]
+    return input.new_empty(dims, dtype=input.dtype)
+
+  dims = []
+  for sym in shape.split(","):
+    if sym.isdigit():
+      dims.append(int(sym))
     else:
-      nnz = ctx.new_dynamic_size()
-      shape.append(nnz)
-  return input.new_empty(shape, dtype=input.dtype)
+      dims.append(ctx.new_dynamic_size())
+  return input.new_empty(dims, dtype=input.dtype)
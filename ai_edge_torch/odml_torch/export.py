@@ -215,6 +215,14 @@ class MlirLowered:
         )
     )
 
+  def write_text(self, writer, enable_debug_info=False):
+    """Writes the MLIR text to a writer without materializing a full string."""
+    self.module.operation.print(
+        file=writer,
+        enable_debug_info=enable_debug_info,
+        large_elements_limit=16,
+    )
+
   @property
   def module_bytecode(self) -> bytes:
     output = io.BytesIO()
@@ -352,10 +360,17 @@ def exported_program_to_mlir(
     The lowered MLIR module, metadata, and weight tensors bundle from exported
     program.
   """
+  pre_decomp_program = exported_program
   exported_program = fx_infra.safe_run_decompositions(
       exported_program,
       fx_infra.decomp.pre_lower_decomp(),
   )
+  if exported_program is pre_decomp_program:
+    # safe_run_decompositions returns the caller's program unchanged when no
+    # decomposition applies. The passes below mutate the program in place, so
+    # retrace to get a private copy before modifying it.
+    exported_program = fx_infra.safe_run_decompositions(exported_program, {})
+
   if _convert_i64_to_i32(exported_program):
     # Run decompositions for retracing and cananicalization, if modified.
     exported_program = fx_infra.safe_run_decompositions(exported_program, {})